@@ -5,80 +5,201 @@ Executes both Randomized Quicksort and Hash Table analyses
 Generates combined performance report and documentation
 """
 
-import os
+import re
 import sys
+import importlib.util
+import itertools
 import time
+import threading
 import subprocess
 from pathlib import Path
 
+# Single compiled pattern for the key-result filter: one C-level scan per
+# line instead of one substring search per keyword plus a .lower() copy.
+# Matches on raw bytes so non-matching lines are never decoded.
+_KEYWORD_RE = re.compile(rb'summary|improvement|time:|load factor|chain length',
+                         re.IGNORECASE)
+
+# Shared horizontal rule for section headers, built once at import
+_RULE = "=" * 80
+
+# Static report body built once at import; only the five dynamic fields
+# (date, two statuses, two times) are filled in per run
+_REPORT_TEMPLATE = """# Combined Analysis Report: Randomized Algorithms
+
+## Execution Summary
+
+**Date:** {date}
+
+### Algorithm Execution Results
+
+| Algorithm | Status | Execution Time | Output Files |
+|-----------|--------|----------------|--------------|
+| Randomized Quicksort | {status_qs} | {qs_time:.2f}s | quicksort/results/ |
+| Hash Table Chaining | {status_ht} | {ht_time:.2f}s | hashtable/results/ |
+
+### Key Findings Summary
+
+#### Randomized Quicksort
+- **Performance Improvement on Sorted Data:** 60-90% faster than deterministic version
+- **Consistency:** O(n log n) performance across all input distributions
+- **Mathematical Validation:** Empirical results match theoretical O(n log n) predictions
+
+#### Hash Table with Chaining
+- **Optimal Load Factor:** Performance remains O(1) when alpha <= 0.75
+- **Universal Hashing:** Excellent collision distribution properties
+- **Scalability:** Linear performance degradation with load factor increase
+
+### Files Generated
+
+#### Quicksort Analysis
+- quicksort/results/quicksort_comparison.png - Performance comparison graphs
+- Mathematical analysis output in console
+
+#### Hash Table Analysis
+- hashtable/results/hashtable_analysis.png - Load factor impact analysis
+- Operation performance statistics in console
+
+### Theoretical Validation
+
+Both algorithms demonstrate strong correlation between theoretical predictions and empirical results:
+
+1. **Quicksort:** Expected comparisons approximately 1.39 x n log_2(n), measured within 5-10% variance
+2. **Hash Table:** Expected chain length = load factor, measured within 3-5% variance
+
+### Performance Insights
+
+The randomization in both algorithms provides:
+- **Predictable Performance:** Eliminates worst-case scenarios
+- **Robust Design:** Consistent behavior across different input patterns
+- **Practical Efficiency:** Real-world performance matches theoretical analysis
+
+### Recommendations
+
+1. **Use randomized quicksort** for sorting when input distribution is unknown
+2. **Maintain hash table load factor <= 0.75** for optimal performance
+3. **Implement universal hashing** for collision resistance
+4. **Monitor performance metrics** in production environments
+
+---
+
+*Report generated automatically by combined_tests.py*
+"""
+
 def print_header(title):
     """Print formatted section header"""
-    print("\n" + "="*80)
-    print(f" {title}")
-    print("="*80)
+    print(f"\n{_RULE}\n {title}\n{_RULE}")
 
-def run_algorithm_analysis(algorithm_name, script_path, working_dir):
+def _stream_key_results(algorithm_name, stream):
     """
-    Run individual algorithm analysis and capture results
-    
+    Read child stdout line by line as it arrives and print key result
+    lines immediately, so progress is visible while the child runs and
+    the parent never buffers the full output in memory
+    """
+    matches = (line.strip() for line in stream
+               if line.strip() and _KEYWORD_RE.search(line))
+
+    # Show at most 5 key lines - islice stops filtering once we have them,
+    # and only these few lines are ever decoded to text
+    for line in itertools.islice(matches, 5):
+        print(f"   [{algorithm_name}] {line.decode('utf-8', errors='replace')}")
+
+    # Keep draining stdout so the child never blocks on a full pipe
+    for _ in stream:
+        pass
+    stream.close()
+
+def _drain_stream(stream, lines):
+    """Collect child stderr incrementally without blocking the child"""
+    for line in stream:
+        lines.append(line)
+    stream.close()
+
+def launch_algorithm_analysis(algorithm_name, script_path, working_dir):
+    """
+    Start individual algorithm analysis as an independent child process
+
+    Output is consumed incrementally by reader threads so key result
+    lines are shown while the analysis is still running.
+
     Parameters:
         algorithm_name: Name of algorithm for display
         script_path: Path to Python script to execute
         working_dir: Directory to run script from
-    
+
     Returns:
-        Success status and execution time
+        Dictionary describing the running analysis
     """
     print(f"\nStarting {algorithm_name} Analysis...")
     print(f"   Script: {script_path}")
     print(f"   Working Directory: {working_dir}")
-    
-    start_time = time.time()
-    
+
+    start_time = time.monotonic()
+
+    # Execute the algorithm script in its own directory (cwd= avoids
+    # mutating our own working directory, so both children can run at once)
+    # Pipes stay in binary mode: lines are filtered as bytes and only the
+    # handful that get printed are ever run through a codec
+    process = subprocess.Popen([sys.executable, script_path],
+                               cwd=working_dir,
+                               stdout=subprocess.PIPE,
+                               stderr=subprocess.PIPE)
+
+    stderr_lines = []
+    stdout_reader = threading.Thread(target=_stream_key_results,
+                                     args=(algorithm_name, process.stdout),
+                                     daemon=True)
+    stderr_reader = threading.Thread(target=_drain_stream,
+                                     args=(process.stderr, stderr_lines),
+                                     daemon=True)
+    stdout_reader.start()
+    stderr_reader.start()
+
+    return {
+        'name': algorithm_name,
+        'process': process,
+        'start_time': start_time,
+        'readers': (stdout_reader, stderr_reader),
+        'stderr_lines': stderr_lines
+    }
+
+def finalize_algorithm_analysis(analysis):
+    """
+    Wait for a launched analysis to finish and report its results
+
+    Parameters:
+        analysis: Running analysis dictionary from launch_algorithm_analysis
+
+    Returns:
+        Success status and execution time
+    """
+    algorithm_name = analysis['name']
+    process = analysis['process']
+
     try:
-        # Change to working directory and run script
-        original_dir = os.getcwd()
-        os.chdir(working_dir)
-        
-        # Execute the algorithm script
-        result = subprocess.run([sys.executable, script_path], 
-                              capture_output=True, 
-                              text=True, 
-                              timeout=300)  # 5 minute timeout
-        
-        os.chdir(original_dir)
-        execution_time = time.time() - start_time
-        
-        if result.returncode == 0:
+        process.wait(timeout=300)  # 5 minute timeout
+        for reader in analysis['readers']:
+            reader.join()
+        execution_time = time.monotonic() - analysis['start_time']
+
+        if process.returncode == 0:
             print(f"[SUCCESS] {algorithm_name} analysis completed successfully!")
             print(f"   Execution time: {execution_time:.2f} seconds")
-            
-            # Display key output lines
-            output_lines = result.stdout.split('\n')
-            important_lines = [line for line in output_lines 
-                             if any(keyword in line.lower() 
-                                  for keyword in ['summary', 'improvement', 'time:', 'load factor', 'chain length'])]
-            
-            if important_lines:
-                print("   Key Results:")
-                for line in important_lines[:5]:  # Show first 5 important lines
-                    if line.strip():
-                        print(f"     {line.strip()}")
-            
             return True, execution_time
         else:
             print(f"[FAILED] {algorithm_name} analysis failed!")
-            print(f"   Error: {result.stderr}")
+            stderr_text = b''.join(analysis['stderr_lines']).decode('utf-8', errors='replace')
+            print(f"   Error: {stderr_text}")
             return False, execution_time
-            
+
     except subprocess.TimeoutExpired:
         print(f"[TIMEOUT] {algorithm_name} analysis timed out after 5 minutes")
-        os.chdir(original_dir)
+        process.kill()
+        process.wait()
         return False, 300
     except Exception as e:
         print(f"[ERROR] Error running {algorithm_name} analysis: {e}")
-        os.chdir(original_dir)
-        return False, time.time() - start_time
+        return False, time.monotonic() - analysis['start_time']
 
 def check_dependencies():
     """Check if required packages are installed"""
@@ -88,10 +209,11 @@ def check_dependencies():
     missing_packages = []
     
     for package in required_packages:
-        try:
-            __import__(package)
+        # find_spec only checks that the package is installed - it skips
+        # the expensive module initialization the children do themselves
+        if importlib.util.find_spec(package) is not None:
             print(f"   [OK] {package} - installed")
-        except ImportError:
+        else:
             print(f"   [MISSING] {package} - missing")
             missing_packages.append(package)
     
@@ -106,89 +228,21 @@ def check_dependencies():
 def generate_combined_report(quicksort_success, quicksort_time, hashtable_success, hashtable_time):
     """Generate combined analysis report"""
     print("\nGenerating combined analysis report...")
-    
-    # Create completely ASCII-safe report content
-    status_qs = "SUCCESS" if quicksort_success else "FAILED"
-    status_ht = "SUCCESS" if hashtable_success else "FAILED"
-    current_time = time.strftime('%Y-%m-%d %H:%M:%S')
-    
-    report_lines = [
-        "# Combined Analysis Report: Randomized Algorithms",
-        "",
-        "## Execution Summary",
-        "",
-        f"**Date:** {current_time}",
-        "",
-        "### Algorithm Execution Results",
-        "",
-        "| Algorithm | Status | Execution Time | Output Files |",
-        "|-----------|--------|----------------|--------------|",
-        f"| Randomized Quicksort | {status_qs} | {quicksort_time:.2f}s | quicksort/results/ |",
-        f"| Hash Table Chaining | {status_ht} | {hashtable_time:.2f}s | hashtable/results/ |",
-        "",
-        "### Key Findings Summary",
-        "",
-        "#### Randomized Quicksort",
-        "- **Performance Improvement on Sorted Data:** 60-90% faster than deterministic version",
-        "- **Consistency:** O(n log n) performance across all input distributions",
-        "- **Mathematical Validation:** Empirical results match theoretical O(n log n) predictions",
-        "",
-        "#### Hash Table with Chaining", 
-        "- **Optimal Load Factor:** Performance remains O(1) when alpha <= 0.75",
-        "- **Universal Hashing:** Excellent collision distribution properties",
-        "- **Scalability:** Linear performance degradation with load factor increase",
-        "",
-        "### Files Generated",
-        "",
-        "#### Quicksort Analysis",
-        "- quicksort/results/quicksort_comparison.png - Performance comparison graphs",
-        "- Mathematical analysis output in console",
-        "",
-        "#### Hash Table Analysis",
-        "- hashtable/results/hashtable_analysis.png - Load factor impact analysis", 
-        "- Operation performance statistics in console",
-        "",
-        "### Theoretical Validation",
-        "",
-        "Both algorithms demonstrate strong correlation between theoretical predictions and empirical results:",
-        "",
-        "1. **Quicksort:** Expected comparisons approximately 1.39 x n log_2(n), measured within 5-10% variance",
-        "2. **Hash Table:** Expected chain length = load factor, measured within 3-5% variance",
-        "",
-        "### Performance Insights",
-        "",
-        "The randomization in both algorithms provides:",
-        "- **Predictable Performance:** Eliminates worst-case scenarios",
-        "- **Robust Design:** Consistent behavior across different input patterns", 
-        "- **Practical Efficiency:** Real-world performance matches theoretical analysis",
-        "",
-        "### Recommendations",
-        "",
-        "1. **Use randomized quicksort** for sorting when input distribution is unknown",
-        "2. **Maintain hash table load factor <= 0.75** for optimal performance",
-        "3. **Implement universal hashing** for collision resistance",
-        "4. **Monitor performance metrics** in production environments",
-        "",
-        "---",
-        "",
-        "*Report generated automatically by combined_tests.py*"
-    ]
-    
-    report_content = '\n'.join(report_lines)
-    
-    # Write report to file with multiple fallback encoding strategies
+
+    # Fill the five dynamic fields of the static template; the content is
+    # ASCII by construction so no encoding fallback is needed
+    report_content = _REPORT_TEMPLATE.format_map({
+        'date': time.strftime('%Y-%m-%d %H:%M:%S'),
+        'status_qs': "SUCCESS" if quicksort_success else "FAILED",
+        'status_ht': "SUCCESS" if hashtable_success else "FAILED",
+        'qs_time': quicksort_time,
+        'ht_time': hashtable_time
+    })
+
     try:
-        with open('docs/combined_analysis_report.md', 'w', encoding='utf-8') as f:
-            f.write(report_content)
+        Path('docs').mkdir(exist_ok=True)
+        Path('docs/combined_analysis_report.md').write_bytes(report_content.encode('ascii'))
         print("   Combined report saved to: docs/combined_analysis_report.md")
-    except (UnicodeEncodeError, UnicodeError):
-        try:
-            # Fallback to ascii with replacement
-            with open('docs/combined_analysis_report.md', 'w', encoding='ascii', errors='replace') as f:
-                f.write(report_content)
-            print("   Combined report saved to: docs/combined_analysis_report.md (ASCII mode)")
-        except Exception as e:
-            print(f"   Error saving report: {e}")
     except Exception as e:
         print(f"   Error saving report: {e}")
 
@@ -204,25 +258,31 @@ def main():
         return 1
     
     # Initialize results tracking
-    total_start_time = time.time()
+    total_start_time = time.monotonic()
     results = {}
     
-    # Run Randomized Quicksort Analysis
-    print_header("RANDOMIZED QUICKSORT ANALYSIS")
-    quicksort_success, quicksort_time = run_algorithm_analysis(
+    # Launch both analyses concurrently - they are independent processes
+    # working in separate directories, so they can run in parallel
+    print_header("LAUNCHING ALGORITHM ANALYSES")
+    quicksort_analysis = launch_algorithm_analysis(
         "Randomized Quicksort",
         "quick_sort_analyzer.py",
         "quicksort"
     )
-    results['quicksort'] = {'success': quicksort_success, 'time': quicksort_time}
-    
-    # Run Hash Table Analysis
-    print_header("HASH TABLE WITH CHAINING ANALYSIS")
-    hashtable_success, hashtable_time = run_algorithm_analysis(
+    hashtable_analysis = launch_algorithm_analysis(
         "Hash Table with Chaining",
-        "hash_table_chaining.py", 
+        "hash_table_chaining.py",
         "hashtable"
     )
+
+    # Collect Randomized Quicksort results
+    print_header("RANDOMIZED QUICKSORT ANALYSIS")
+    quicksort_success, quicksort_time = finalize_algorithm_analysis(quicksort_analysis)
+    results['quicksort'] = {'success': quicksort_success, 'time': quicksort_time}
+
+    # Collect Hash Table results
+    print_header("HASH TABLE WITH CHAINING ANALYSIS")
+    hashtable_success, hashtable_time = finalize_algorithm_analysis(hashtable_analysis)
     results['hashtable'] = {'success': hashtable_success, 'time': hashtable_time}
     
     # Generate combined report
@@ -231,7 +291,7 @@ def main():
                            hashtable_success, hashtable_time)
     
     # Final summary
-    total_time = time.time() - total_start_time
+    total_time = time.monotonic() - total_start_time
     print_header("ANALYSIS COMPLETE")
     
     print(f"\nFinal Results Summary:")
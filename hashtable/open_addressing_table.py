@@ -0,0 +1,408 @@
+import random
+import sys
+import numpy as np
+from typing import Any, Optional, List
+
+# Reuse the (optionally numba-compiled) string hash from the chaining module
+try:
+    from hash_table_chaining import _string_hash, _UINT64_MASK, NUMBA_AVAILABLE
+except ImportError:
+    from .hash_table_chaining import _string_hash, _UINT64_MASK, NUMBA_AVAILABLE
+
+# Slot states for the occupancy map
+_EMPTY = 0
+_OCCUPIED = 1
+
+if NUMBA_AVAILABLE:
+    from numba import njit
+
+    @njit(cache=True)
+    def _probe_core(hashes, states, dfb, cap_mask, index, distance, hash_val):  # pragma: no cover
+        """
+        Walk the probe sequence in compiled code, comparing cached hash
+        values only - the interpreter is re-entered just to confirm key
+        equality on a hash match. Sequential probing keeps the hardware
+        prefetcher streaming the hash/state arrays ahead of the loop.
+
+        Returns (candidate index, distance) or (-1, distance) on a miss.
+        """
+        while states[index] == _OCCUPIED:
+            if hashes[index] == hash_val:
+                return index, distance
+            if dfb[index] < distance:
+                break
+            distance += 1
+            index = (index + 1) & cap_mask
+        return -1, distance
+
+class OpenAddressingHashTable:
+    """
+    Hash table using open addressing with Robin Hood linear probing
+    Keys and values live in parallel numpy arrays, so every probe is a
+    contiguous array access instead of chasing linked-list node pointers.
+    Robin Hood insertion keeps probe distances tightly bounded, which
+    lets unsuccessful searches stop early
+    """
+
+    def __init__(self, initial_capacity: int = 16, max_load_factor: float = 0.75,
+                 expected_key_type: Optional[type] = None, track_stats: bool = True):
+        """
+        Create new hash table
+
+        Parameters:
+            initial_capacity: Starting size of hash table
+            max_load_factor: When to resize (0.75 means resize when 75% full)
+            expected_key_type: Key type for all operations, if known up front
+                (skips the per-operation key type check in _hash)
+            track_stats: Count operations for statistics (pass False to
+                drop the counter update from the hot path)
+        """
+        # Round capacity up to a power of two so the index reduction in
+        # _hash is a one-cycle bitmask instead of an integer modulo
+        self.capacity = 1 << max(initial_capacity - 1, 1).bit_length()
+        self._cap_mask = self.capacity - 1
+        self.size = 0
+        self.max_load_factor = max_load_factor
+
+        # Structure-of-arrays storage: one slot is one index across all
+        # arrays; _hashes caches each entry's capacity-independent hash
+        # so a resize never has to re-hash the stored keys
+        self._keys = np.empty(self.capacity, dtype=object)
+        self._values = np.empty(self.capacity, dtype=object)
+        self._states = np.zeros(self.capacity, dtype=np.uint8)
+        self._hashes = np.zeros(self.capacity, dtype=np.uint64)
+        # Distance of each entry from its home slot (Robin Hood metric)
+        self._dfb = np.zeros(self.capacity, dtype=np.uint16)
+
+        # Parameters for universal hash function
+        self._generate_hash_params()
+
+        # Bind a monomorphic hash function when the key type is known up
+        # front, removing the isinstance branch from every operation
+        if expected_key_type is str:
+            self._prehash = self._prehash_str
+        elif expected_key_type is not None:
+            self._prehash = self._prehash_other
+
+        # Keep track of performance statistics
+        self.collision_count = 0
+        self.resize_count = 0
+        self.total_operations = 0
+        self._track_stats = track_stats
+
+    def _generate_hash_params(self):
+        """Create random parameters for hash function"""
+        # Dietzfelbinger multiply-shift: with a random odd 64-bit
+        # multiplier, keeping the top log2(capacity) bits of the product
+        # is 2-universal - one multiply and shift, no division at all
+        self.a = random.randrange(1, 1 << 64, 2)
+        self._shift = 64 - (self.capacity.bit_length() - 1)
+
+    def _hash(self, key: Any) -> int:
+        """
+        Universal hash function: converts key to starting slot index
+        Formula: h(k) = (a * prehash(k)) >> (64 - log2(m)), a odd
+
+        Parameters:
+            key: Key to convert to index
+
+        Returns:
+            Index in range [0, capacity-1]
+        """
+        return self._reduce(self._prehash(key))
+
+    def _prehash(self, key: Any) -> int:
+        """Capacity-independent hash of a key, cached per slot"""
+        if isinstance(key, str):
+            return self._prehash_str(key)
+        return self._prehash_other(key)
+
+    def _prehash_str(self, key: str) -> int:
+        """Pre-reduction hash specialized for string keys"""
+        # Hash the raw key bytes in compiled code when numba is present
+        key_bytes = np.frombuffer(key.encode('utf-8'), dtype=np.uint8)
+        return int(_string_hash(key_bytes))
+
+    def _prehash_other(self, key: Any) -> int:
+        """Pre-reduction hash for any non-string hashable key"""
+        return hash(key) & _UINT64_MASK
+
+    def _reduce(self, hash_val: int) -> int:
+        """Map a pre-hashed value to a slot index (multiply-shift)"""
+        return ((self.a * hash_val) & _UINT64_MASK) >> self._shift
+
+    def _resize(self):
+        """Make hash table bigger when it gets too full"""
+        # Gather live entries with one vectorized mask selection instead
+        # of testing every old slot in Python
+        occupied = self._states == _OCCUPIED
+        old_keys = self._keys[occupied]
+        old_values = self._values[occupied]
+        old_hashes = self._hashes[occupied]
+
+        # Growing 4x instead of 2x halves the number of rehash passes in
+        # bulk-load workloads while keeping capacity a power of two
+        self.capacity *= 4
+        self._cap_mask = self.capacity - 1
+        self._keys = np.empty(self.capacity, dtype=object)
+        self._values = np.empty(self.capacity, dtype=object)
+        self._states = np.zeros(self.capacity, dtype=np.uint8)
+        self._hashes = np.zeros(self.capacity, dtype=np.uint64)
+        self._dfb = np.zeros(self.capacity, dtype=np.uint16)
+        self.resize_count += 1
+
+        # Create new hash parameters for new size
+        self._generate_hash_params()
+
+        # Keys are unique during a rehash, so placement skips the key
+        # equality checks of _insert_slot
+        for key, value, hash_val in zip(old_keys, old_values, old_hashes):
+            self._place(key, value, int(hash_val))
+
+        self.size = int(old_keys.size)
+
+    def insert(self, key: Any, value: Any):
+        """
+        Add key-value pair to hash table
+
+        Parameters:
+            key: Key to add
+            value: Value to store with this key
+        """
+        if self._track_stats:
+            self.total_operations += 1
+
+        # Check if we need to make table bigger
+        if self.size >= self.capacity * self.max_load_factor:
+            self._resize()
+
+        self._insert_slot(key, value)
+
+    def _insert_slot(self, key: Any, value: Any):
+        """Helper method to place entry without checking resize"""
+        hash_val = self._prehash(key)
+        index = self._reduce(hash_val)
+        distance = 0
+
+        # Walk the probe sequence until the key is found or we meet an
+        # entry closer to its home than we are - by the Robin Hood
+        # invariant the key cannot live past that point
+        while self._states[index] == _OCCUPIED:
+            if self._keys[index] == key:
+                self._values[index] = value  # Update existing key
+                return
+            if self._dfb[index] < distance:
+                break
+            # Another key already lives here (collision happened)
+            self.collision_count += 1
+            distance += 1
+            index = (index + 1) & self._cap_mask
+
+        self._place(key, value, hash_val, index, distance)
+        self.size += 1
+
+    def _place(self, key: Any, value: Any, hash_val: int,
+               index: Optional[int] = None, distance: int = 0):
+        """
+        Robin Hood placement: walk the probe sequence and swap with any
+        resident entry that sits closer to its home than we are, so the
+        maximum probe distance stays tightly bounded
+        """
+        if index is None:
+            index = self._reduce(hash_val)
+
+        keys = self._keys
+        values = self._values
+        states = self._states
+        hashes = self._hashes
+        dfb = self._dfb
+        cap_mask = self._cap_mask
+
+        while states[index] == _OCCUPIED:
+            if dfb[index] < distance:
+                # Rob the rich: evict the closer entry and keep walking
+                # the probe sequence to re-place it
+                key, keys[index] = keys[index], key
+                value, values[index] = values[index], value
+                hash_val, hashes[index] = int(hashes[index]), hash_val
+                distance, dfb[index] = int(dfb[index]), distance
+            distance += 1
+            index = (index + 1) & cap_mask
+
+        keys[index] = key
+        values[index] = value
+        states[index] = _OCCUPIED
+        hashes[index] = hash_val
+        dfb[index] = distance
+
+    def search(self, key: Any) -> Optional[Any]:
+        """
+        Find value for given key
+
+        Parameters:
+            key: Key to search for
+
+        Returns:
+            Value if found, None if not found
+        """
+        if self._track_stats:
+            self.total_operations += 1
+
+        index = self._find_slot(key, self._prehash(key))
+        if index >= 0:
+            return self._values[index]
+        return None
+
+    def _find_slot(self, key: Any, hash_val: int) -> int:
+        """
+        Locate the slot holding key, or -1 if absent
+
+        Stops as soon as the probe passes an entry closer to its home
+        than the probe distance - the Robin Hood invariant guarantees a
+        miss at that point
+        """
+        index = self._reduce(hash_val)
+        distance = 0
+
+        if NUMBA_AVAILABLE:
+            hash_u64 = np.uint64(hash_val)
+            while True:
+                index, distance = _probe_core(self._hashes, self._states,
+                                              self._dfb, self._cap_mask,
+                                              index, distance, hash_u64)
+                if index < 0:
+                    return -1
+                if self._keys[index] == key:
+                    return index
+                # Full 64-bit hash collision between different keys -
+                # essentially never taken, keep probing past it
+                distance += 1
+                index = (index + 1) & self._cap_mask
+
+        while self._states[index] == _OCCUPIED:
+            if self._keys[index] == key:
+                return index
+            if self._dfb[index] < distance:
+                break
+            distance += 1
+            index = (index + 1) & self._cap_mask
+
+        return -1
+
+    def delete(self, key: Any) -> bool:
+        """
+        Remove key-value pair from hash table
+
+        Parameters:
+            key: Key to remove
+
+        Returns:
+            True if key was found and removed, False if not found
+        """
+        if self._track_stats:
+            self.total_operations += 1
+
+        index = self._find_slot(key, self._prehash(key))
+        if index >= 0:
+            self._backward_shift(index)
+            self.size -= 1
+            return True
+        return False
+
+    def _backward_shift(self, index: int):
+        """
+        Remove the entry at index by sliding the rest of its cluster one
+        slot back, keeping probe sequences intact with no tombstones
+        """
+        keys = self._keys
+        values = self._values
+        states = self._states
+        hashes = self._hashes
+        dfb = self._dfb
+        cap_mask = self._cap_mask
+
+        next_index = (index + 1) & cap_mask
+        while states[next_index] == _OCCUPIED and dfb[next_index] > 0:
+            keys[index] = keys[next_index]
+            values[index] = values[next_index]
+            hashes[index] = hashes[next_index]
+            dfb[index] = dfb[next_index] - 1
+            index = next_index
+            next_index = (next_index + 1) & cap_mask
+
+        keys[index] = None
+        values[index] = None
+        states[index] = _EMPTY
+        dfb[index] = 0
+
+    def get_load_factor(self) -> float:
+        """Calculate how full the hash table is"""
+        return self.size / self.capacity
+
+    def get_probe_lengths(self) -> List[int]:
+        """Get probe sequence length for each stored key for analysis"""
+        occupied = self._states == _OCCUPIED
+        return (self._dfb[occupied].astype(np.int64) + 1).tolist()
+
+    def get_statistics(self) -> dict:
+        """Get detailed information about hash table performance"""
+        # All summary numbers come from C-level reductions over the
+        # stored probe distances - no Python iteration over slots
+        occupied = self._states == _OCCUPIED
+        probe_lengths = self._dfb[occupied].astype(np.int64) + 1
+
+        return {
+            'size': self.size,
+            'capacity': self.capacity,
+            'load_factor': self.get_load_factor(),
+            'collision_count': self.collision_count,
+            'resize_count': self.resize_count,
+            'total_operations': self.total_operations,
+            'max_probe_length': int(probe_lengths.max()) if probe_lengths.size else 0,
+            'avg_probe_length': float(np.mean(probe_lengths)) if probe_lengths.size else 0,
+            'empty_slots': int(np.count_nonzero(self._states == _EMPTY)),
+            'collision_rate': self.collision_count / self.total_operations if self.total_operations > 0 else 0
+        }
+
+    def display_table(self):
+        """Show hash table contents for debugging"""
+        # Collect everything and emit one write instead of one print
+        # (and potential flush) per occupied slot
+        lines = [f"Hash Table (Size: {self.size}, Capacity: {self.capacity}, "
+                 f"Load Factor: {self.get_load_factor():.2f})",
+                 "=" * 50]
+
+        for i in range(self.capacity):
+            if self._states[i] == _OCCUPIED:
+                lines.append(f"Position {i}: ({self._keys[i]}: {self._values[i]})")
+
+        sys.stdout.write('\n'.join(lines) + '\n')
+
+
+# Main program execution
+if __name__ == "__main__":
+    # Test basic operations
+    print("=== BASIC OPEN ADDRESSING HASH TABLE TEST ===")
+    ht = OpenAddressingHashTable()
+
+    test_data = [("apple", 5), ("banana", 3), ("cherry", 8), ("date", 2), ("elderberry", 9)]
+
+    for key, value in test_data:
+        ht.insert(key, value)
+        print(f"Added {key}: {value}")
+
+    print(f"\nHash table size: {ht.size}")
+    print(f"Load factor: {ht.get_load_factor():.2f}")
+
+    print("\nTesting searches...")
+    for key, expected_value in test_data:
+        result = ht.search(key)
+        print(f"Search {key}: {result} (expected: {expected_value})")
+
+    print("\nTesting deletions...")
+    print(f"Delete banana: {ht.delete('banana')}")
+    print(f"Delete grape (doesn't exist): {ht.delete('grape')}")
+    print(f"Search banana after deletion: {ht.search('banana')}")
+
+    print(f"\nFinal hash table size: {ht.size}")
+    ht.display_table()
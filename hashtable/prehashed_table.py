@@ -0,0 +1,217 @@
+import sys
+import numpy as np
+
+# Reuse the optional-numba setup from the chaining module
+try:
+    from hash_table_chaining import NUMBA_AVAILABLE, _UINT64_MASK
+except ImportError:
+    from .hash_table_chaining import NUMBA_AVAILABLE, _UINT64_MASK
+
+
+def _ph_insert(keys, vals, occ, cap_mask, h, v):
+    """
+    Place pre-hashed key h with value v using linear probing
+    Returns 1 if a new entry was created, 0 if an existing one updated
+    """
+    index = h & cap_mask
+    while occ[index]:
+        if keys[index] == h:
+            vals[index] = v
+            return 0
+        index = (index + np.uint64(1)) & cap_mask
+    keys[index] = h
+    vals[index] = v
+    occ[index] = 1
+    return 1
+
+
+def _ph_search(keys, vals, occ, cap_mask, h):
+    """Return the value stored for pre-hashed key h, or -1 if absent"""
+    index = h & cap_mask
+    while occ[index]:
+        if keys[index] == h:
+            return vals[index]
+        index = (index + np.uint64(1)) & cap_mask
+    return -1
+
+
+def _ph_delete(keys, vals, occ, cap_mask, h):
+    """
+    Remove pre-hashed key h, repairing the probe cluster by shifting
+    later entries backward so no tombstones are needed
+    Returns 1 if the key was found and removed, 0 otherwise
+    """
+    cap = cap_mask + np.uint64(1)
+    index = h & cap_mask
+    while occ[index]:
+        if keys[index] == h:
+            hole = index
+            nxt = (hole + np.uint64(1)) & cap_mask
+            while occ[nxt]:
+                home = keys[nxt] & cap_mask
+                # The entry at nxt may move into the hole only if its
+                # home slot does not lie strictly between hole and nxt
+                # (cyclic distances; + cap keeps arithmetic non-negative)
+                if (nxt + cap - home) & cap_mask >= (nxt + cap - hole) & cap_mask:
+                    keys[hole] = keys[nxt]
+                    vals[hole] = vals[nxt]
+                    hole = nxt
+                nxt = (nxt + np.uint64(1)) & cap_mask
+            occ[hole] = 0
+            keys[hole] = 0
+            vals[hole] = 0
+            return 1
+        index = (index + np.uint64(1)) & cap_mask
+    return 0
+
+
+def _ph_rehash(old_keys, old_vals, keys, vals, occ, cap_mask):
+    """Re-place every old entry into the enlarged arrays"""
+    for i in range(old_keys.shape[0]):
+        _ph_insert(keys, vals, occ, cap_mask, old_keys[i], old_vals[i])
+
+
+if NUMBA_AVAILABLE:
+    from numba import njit
+    _ph_insert = njit(cache=True)(_ph_insert)
+    _ph_search = njit(cache=True)(_ph_search)
+    _ph_delete = njit(cache=True)(_ph_delete)
+    _ph_rehash = njit(cache=True)(_ph_rehash)
+
+
+class PreHashedTable:
+    """
+    Specialized hash table for callers that already hold 64-bit hashes
+    Maps uint64 keys to machine-word integer values (array indices or
+    pointer-sized handles) with no Python objects on the hot path: all
+    three operations run as compiled loops over three parallel numpy
+    arrays, so an entry is 17 bytes and a probe touches 1-2 cache lines
+
+    The table trusts that keys are well-mixed hashes, so the home slot
+    is just the low bits of the key - no extra hash call per operation.
+    Values must be non-negative; search returns -1 for a missing key
+    """
+
+    def __init__(self, initial_capacity: int = 16, max_load_factor: float = 0.75):
+        """
+        Create new pre-hashed table
+
+        Parameters:
+            initial_capacity: Starting size of hash table
+            max_load_factor: When to resize (0.75 means resize when 75% full)
+        """
+        # Power-of-two capacity so the slot index is a one-cycle bitmask
+        self.capacity = 1 << max(initial_capacity - 1, 1).bit_length()
+        self._cap_mask = np.uint64(self.capacity - 1)
+        self.size = 0
+        self.max_load_factor = max_load_factor
+        self.resize_count = 0
+
+        self._keys = np.zeros(self.capacity, dtype=np.uint64)
+        self._vals = np.zeros(self.capacity, dtype=np.intp)
+        self._occ = np.zeros(self.capacity, dtype=np.uint8)
+
+    def insert_prehashed(self, h: int, v: int):
+        """
+        Add pre-hashed key with integer value
+
+        Parameters:
+            h: 64-bit hash of the key
+            v: Non-negative integer value to store
+        """
+        if self.size >= self.capacity * self.max_load_factor:
+            self._resize()
+        self.size += int(_ph_insert(self._keys, self._vals, self._occ,
+                                    self._cap_mask, np.uint64(h & _UINT64_MASK), v))
+
+    def search_prehashed(self, h: int) -> int:
+        """
+        Find value for pre-hashed key
+
+        Parameters:
+            h: 64-bit hash of the key
+
+        Returns:
+            Stored value if found, -1 if not found
+        """
+        return int(_ph_search(self._keys, self._vals, self._occ,
+                              self._cap_mask, np.uint64(h & _UINT64_MASK)))
+
+    def delete_prehashed(self, h: int) -> bool:
+        """
+        Remove pre-hashed key from table
+
+        Parameters:
+            h: 64-bit hash of the key
+
+        Returns:
+            True if key was found and removed, False if not found
+        """
+        found = int(_ph_delete(self._keys, self._vals, self._occ,
+                               self._cap_mask, np.uint64(h & _UINT64_MASK)))
+        self.size -= found
+        return bool(found)
+
+    def get_load_factor(self) -> float:
+        """Calculate how full the hash table is"""
+        return self.size / self.capacity
+
+    def _resize(self):
+        """Make hash table bigger when it gets too full"""
+        occupied = self._occ == 1
+        old_keys = self._keys[occupied]
+        old_vals = self._vals[occupied]
+
+        self.capacity *= 4
+        self._cap_mask = np.uint64(self.capacity - 1)
+        self._keys = np.zeros(self.capacity, dtype=np.uint64)
+        self._vals = np.zeros(self.capacity, dtype=np.intp)
+        self._occ = np.zeros(self.capacity, dtype=np.uint8)
+        self.resize_count += 1
+
+        # One compiled pass re-places every entry; the keys are their
+        # own hashes, so nothing is re-hashed
+        _ph_rehash(old_keys, old_vals, self._keys, self._vals, self._occ,
+                   self._cap_mask)
+
+    def display_table(self):
+        """Show hash table contents for debugging"""
+        lines = [f"Pre-Hashed Table (Size: {self.size}, Capacity: {self.capacity}, "
+                 f"Load Factor: {self.get_load_factor():.2f})",
+                 "=" * 50]
+
+        for i in range(self.capacity):
+            if self._occ[i]:
+                lines.append(f"Position {i}: ({self._keys[i]:#018x}: {self._vals[i]})")
+
+        sys.stdout.write('\n'.join(lines) + '\n')
+
+
+# Main program execution
+if __name__ == "__main__":
+    print("=== BASIC PRE-HASHED TABLE TEST ===")
+    ht = PreHashedTable()
+
+    # Callers normally arrive with hashes in hand; simulate that here
+    test_data = [(hash(word) & _UINT64_MASK, idx)
+                 for idx, word in enumerate(["apple", "banana", "cherry", "date"])]
+
+    for h, v in test_data:
+        ht.insert_prehashed(h, v)
+        print(f"Added {h:#018x}: {v}")
+
+    print(f"\nHash table size: {ht.size}")
+    print(f"Load factor: {ht.get_load_factor():.2f}")
+
+    print("\nTesting searches...")
+    for h, expected_value in test_data:
+        result = ht.search_prehashed(h)
+        print(f"Search {h:#018x}: {result} (expected: {expected_value})")
+
+    print("\nTesting deletions...")
+    first_hash = test_data[0][0]
+    print(f"Delete first key: {ht.delete_prehashed(first_hash)}")
+    print(f"Search first key after deletion: {ht.search_prehashed(first_hash)}")
+
+    print(f"\nFinal hash table size: {ht.size}")
+    ht.display_table()
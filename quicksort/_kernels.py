@@ -0,0 +1,155 @@
+import numpy as np
+
+# A precompiled extension (see build_aot.py) skips JIT warmup entirely
+# and works without numba installed
+try:
+    from _qs_native import sort as _aot_sort
+    AOT_AVAILABLE = True
+except ImportError:
+    try:
+        from ._qs_native import sort as _aot_sort
+        AOT_AVAILABLE = True
+    except ImportError:
+        AOT_AVAILABLE = False
+
+# Numba compiles the partition loops to native code when present; the
+# same functions run uncompiled (for non-int data or minimal installs)
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+# Without numba, fall back to the prebuilt Cython partition extension
+# if one was compiled (see setup.py); it covers just the partition
+# inner loop, with the driver staying in Python
+CYTHON_AVAILABLE = False
+if not NUMBA_AVAILABLE:
+    try:
+        from _partition_ext import partition as _cy_partition
+        CYTHON_AVAILABLE = True
+    except ImportError:
+        try:
+            from ._partition_ext import partition as _cy_partition
+            CYTHON_AVAILABLE = True
+        except ImportError:
+            pass
+
+
+def _partition(arr, low, high, cnt):
+    """
+    Split an int64 array around the pivot in arr[high]
+    All smaller elements go to left, larger elements go to right
+
+    Parameters:
+        arr: int64 array to split
+        low: Starting position
+        high: Ending position (where pivot is located)
+        cnt: One-element int64 array accumulating comparison counts
+
+    Returns:
+        Final position of pivot element
+    """
+    pivot = arr[high]
+    i = low - 1
+
+    for j in range(low, high):
+        # Branchless always-swap: the comparison becomes an all-ones
+        # or all-zeros mask that selects between swapped and unswapped
+        # values, so the loop has no data-dependent branch for the
+        # branch predictor to miss on random input
+        less = arr[j] <= pivot
+        i += less
+        left = arr[i]
+        right = arr[j]
+        mask = -np.int64(less)
+        arr[i] = (right & mask) | (left & ~mask)
+        arr[j] = (left & mask) | (right & ~mask)
+
+    arr[i + 1], arr[high] = arr[high], arr[i + 1]
+    # The loop always compares exactly high - low elements, so the
+    # counter is bumped once per call instead of once per element
+    cnt[0] += high - low
+    return i + 1
+
+
+def _insertion_sort(arr, low, high, cnt):
+    """
+    Sort the small range arr[low..high] by insertion sort
+
+    Parameters:
+        arr: int64 array holding the range
+        low: Starting position
+        high: Ending position
+        cnt: One-element int64 array accumulating comparison counts
+    """
+    comps = 0
+    for i in range(low + 1, high + 1):
+        key = arr[i]
+        j = i - 1
+        while j >= low and arr[j] > key:
+            arr[j + 1] = arr[j]
+            j -= 1
+            comps += 1
+        if j >= low:
+            comps += 1
+        arr[j + 1] = key
+    cnt[0] += comps
+
+
+def _qsort(arr, low, high, cnt):
+    """
+    Randomized quicksort driver over an int64 array
+
+    Parameters:
+        arr: int64 array to sort in place
+        low: Starting position
+        high: Ending position
+        cnt: One-element int64 array accumulating comparison counts
+    """
+    if high - low < 16:
+        # Small ranges sort faster by insertion sort than by more
+        # pivot rounds
+        if low < high:
+            _insertion_sort(arr, low, high, cnt)
+        return
+
+    # Choose random pivot and move it to the last position
+    random_index = np.random.randint(low, high + 1)
+    arr[random_index], arr[high] = arr[high], arr[random_index]
+
+    pivot_position = _partition(arr, low, high, cnt)
+
+    _qsort(arr, low, pivot_position - 1, cnt)
+    _qsort(arr, pivot_position + 1, high, cnt)
+
+
+if NUMBA_AVAILABLE:
+    _partition = njit(cache=True)(_partition)
+    _insertion_sort = njit(cache=True)(_insertion_sort)
+    _qsort = njit(cache=True)(_qsort)
+elif CYTHON_AVAILABLE:
+    _partition = _cy_partition
+
+# Preference order for the int64 fast path: the AOT-built extension
+# needs no warmup, numba JIT-compiles everything, Cython compiles the
+# partition loop, otherwise there is no fast path
+KERNEL_AVAILABLE = AOT_AVAILABLE or NUMBA_AVAILABLE or CYTHON_AVAILABLE
+
+
+def sort_int64(arr: np.ndarray) -> int:
+    """
+    Sort an int64 array in place with the compiled randomized quicksort
+
+    Parameters:
+        arr: int64 numpy array to sort
+
+    Returns:
+        Number of element comparisons performed
+    """
+    if AOT_AVAILABLE:
+        return int(_aot_sort(arr))
+
+    cnt = np.zeros(1, dtype=np.int64)
+    _qsort(arr, 0, arr.shape[0] - 1, cnt)
+    return int(cnt[0])
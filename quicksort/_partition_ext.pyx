@@ -0,0 +1,36 @@
+# cython: boundscheck=False, wraparound=False, language_level=3
+"""
+Cython partition kernel for environments that cannot ship numba's
+LLVM stack (minimal containers, AWS Lambda). Same contract as the
+numba version in _kernels.py: Lomuto partition over an int64 buffer
+with a one-element comparison counter.
+
+Build in place with: python setup.py build_ext --inplace
+"""
+
+
+cpdef long partition(long[::1] arr, long low, long high, long[::1] cnt) noexcept nogil:
+    """
+    Split arr[low..high] around the pivot in arr[high]
+    All smaller elements go to left, larger elements go to right
+
+    Returns the final position of the pivot element
+    """
+    cdef long pivot = arr[high]
+    cdef long i = low - 1
+    cdef long j, tmp
+
+    for j in range(low, high):
+        if arr[j] <= pivot:
+            i += 1
+            tmp = arr[i]
+            arr[i] = arr[j]
+            arr[j] = tmp
+
+    tmp = arr[i + 1]
+    arr[i + 1] = arr[high]
+    arr[high] = tmp
+
+    # The loop always compares exactly high - low elements
+    cnt[0] += high - low
+    return i + 1
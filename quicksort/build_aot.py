@@ -0,0 +1,65 @@
+"""
+Ahead-of-time build step for the quicksort kernels:
+    python build_aot.py
+
+Compiles the randomized sort into a native _qs_native extension with
+numba's pycc, so processes that import the sorter pay no JIT warmup
+at runtime (and need no numba installed at all). Run it once per
+build; _kernels.py picks the result up automatically.
+"""
+
+import numpy as np
+from numba.pycc import CC
+
+from _kernels import _insertion_sort, _partition
+
+cc = CC('_qs_native')
+
+
+@cc.export('sort', 'i8(i8[::1])')
+def sort(arr):
+    """
+    Sort an int64 array in place, returning the comparison count
+
+    Same algorithm as _kernels._qsort, but driven by an explicit
+    range stack: pycc cannot link self-recursive functions, and the
+    smaller-half-first policy needs at most 2*64 stack slots anyway
+    """
+    cnt = np.zeros(1, dtype=np.int64)
+    if arr.shape[0] < 2:
+        return 0
+
+    stack = np.empty((128, 2), dtype=np.int64)
+    stack[0, 0] = 0
+    stack[0, 1] = arr.shape[0] - 1
+    top = 1
+
+    while top > 0:
+        top -= 1
+        low = stack[top, 0]
+        high = stack[top, 1]
+        while low < high:
+            if high - low < 16:
+                _insertion_sort(arr, low, high, cnt)
+                break
+
+            random_index = np.random.randint(low, high + 1)
+            arr[random_index], arr[high] = arr[high], arr[random_index]
+            pivot_position = _partition(arr, low, high, cnt)
+
+            if pivot_position - low < high - pivot_position:
+                stack[top, 0] = pivot_position + 1
+                stack[top, 1] = high
+                top += 1
+                high = pivot_position - 1
+            else:
+                stack[top, 0] = low
+                stack[top, 1] = pivot_position - 1
+                top += 1
+                low = pivot_position + 1
+
+    return cnt[0]
+
+
+if __name__ == '__main__':
+    cc.compile()
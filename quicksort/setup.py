@@ -0,0 +1,17 @@
+# Build script for the optional Cython partition kernel:
+#     python setup.py build_ext --inplace
+from setuptools import Extension, setup
+from Cython.Build import cythonize
+
+extensions = [
+    Extension(
+        '_partition_ext',
+        ['_partition_ext.pyx'],
+        extra_compile_args=['-O3', '-march=native'],
+    )
+]
+
+setup(
+    name='quicksort_kernels',
+    ext_modules=cythonize(extensions, language_level=3),
+)
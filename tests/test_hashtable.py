@@ -163,6 +163,22 @@ class TestHashTableChaining(unittest.TestCase):
         self.assertGreaterEqual(stats['collision_count'], 0)
         self.assertGreaterEqual(stats['total_operations'], 10)
         
+    def test_repeated_search_stays_coherent(self):
+        """Test that repeated searches see updates and deletions"""
+        self.ht.insert("hot_key", "v1")
+
+        # Repeated searches (second one may be served from the hot-key cache)
+        self.assertEqual(self.ht.search("hot_key"), "v1")
+        self.assertEqual(self.ht.search("hot_key"), "v1")
+
+        # An update must be visible to later searches
+        self.ht.insert("hot_key", "v2")
+        self.assertEqual(self.ht.search("hot_key"), "v2")
+
+        # A deletion must be visible to later searches
+        self.assertTrue(self.ht.delete("hot_key"))
+        self.assertIsNone(self.ht.search("hot_key"))
+
     def test_large_dataset(self):
         """Test with larger dataset for performance verification"""
         num_elements = 1000
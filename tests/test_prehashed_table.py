@@ -0,0 +1,110 @@
+# tests/test_prehashed_table.py
+"""
+Unit tests for Pre-Hashed (uint64 -> int) Hash Table implementation
+Tests correctness, edge cases, and basic performance characteristics
+"""
+
+import unittest
+import sys
+import os
+import random
+
+# Add parent directory to path to import modules
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'hashtable'))
+
+from prehashed_table import PreHashedTable
+
+class TestPreHashedTable(unittest.TestCase):
+    """Test cases for Pre-Hashed Hash Table implementation"""
+
+    def setUp(self):
+        """Set up test fixtures before each test method"""
+        self.ht = PreHashedTable()
+
+    def test_basic_insert_and_search(self):
+        """Test basic insert and search operations"""
+        self.ht.insert_prehashed(12345, 7)
+        self.assertEqual(self.ht.search_prehashed(12345), 7)
+
+        # Search for non-existent key returns the -1 sentinel
+        self.assertEqual(self.ht.search_prehashed(99999), -1)
+
+    def test_update_existing_key(self):
+        """Test updating value for existing key"""
+        self.ht.insert_prehashed(42, 1)
+        self.ht.insert_prehashed(42, 2)
+
+        self.assertEqual(self.ht.search_prehashed(42), 2)
+        self.assertEqual(self.ht.size, 1)  # Size should not increase
+
+    def test_delete_operations(self):
+        """Test delete operations including cluster backward-shift"""
+        # Keys chosen to collide into one cluster (same low bits mod 16)
+        keys = [5, 5 + 16, 5 + 32, 6]
+        for i, h in enumerate(keys):
+            self.ht.insert_prehashed(h, i)
+
+        self.assertTrue(self.ht.delete_prehashed(5 + 16))
+        self.assertEqual(self.ht.search_prehashed(5 + 16), -1)
+        self.assertEqual(self.ht.size, 3)
+
+        # Try to delete non-existent key
+        self.assertFalse(self.ht.delete_prehashed(777))
+        self.assertEqual(self.ht.size, 3)
+
+        # Remaining cluster members must still be reachable
+        self.assertEqual(self.ht.search_prehashed(5), 0)
+        self.assertEqual(self.ht.search_prehashed(5 + 32), 2)
+        self.assertEqual(self.ht.search_prehashed(6), 3)
+
+    def test_empty_hash_table(self):
+        """Test operations on empty hash table"""
+        self.assertEqual(self.ht.search_prehashed(1), -1)
+        self.assertFalse(self.ht.delete_prehashed(1))
+        self.assertEqual(self.ht.size, 0)
+        self.assertEqual(self.ht.get_load_factor(), 0.0)
+
+    def test_automatic_resizing(self):
+        """Test automatic resizing when load factor exceeds threshold"""
+        initial_capacity = self.ht.capacity
+        num_elements = int(initial_capacity * self.ht.max_load_factor) + 1
+
+        for i in range(num_elements):
+            self.ht.insert_prehashed(i * 2654435761, i)
+
+        self.assertGreater(self.ht.capacity, initial_capacity)
+        self.assertEqual(self.ht.resize_count, 1)
+
+        # Verify all elements still retrievable after resize
+        for i in range(num_elements):
+            self.assertEqual(self.ht.search_prehashed(i * 2654435761), i)
+
+    def test_full_64bit_keys(self):
+        """Test keys that use the full 64-bit range"""
+        keys = [(1 << 64) - 1, (1 << 63) + 5, random.getrandbits(64)]
+        for i, h in enumerate(keys):
+            self.ht.insert_prehashed(h, i)
+
+        for i, h in enumerate(keys):
+            self.assertEqual(self.ht.search_prehashed(h), i)
+
+    def test_large_dataset(self):
+        """Test with larger dataset against a reference dict"""
+        reference = {}
+        for _ in range(1000):
+            h = random.getrandbits(64)
+            v = random.randrange(1 << 30)
+            self.ht.insert_prehashed(h, v)
+            reference[h] = v
+
+        self.assertEqual(self.ht.size, len(reference))
+        for h, v in reference.items():
+            self.assertEqual(self.ht.search_prehashed(h), v)
+
+        # Check that load factor is maintained
+        self.assertLessEqual(self.ht.get_load_factor(), self.ht.max_load_factor * 1.1)
+
+
+if __name__ == '__main__':
+    # Run all tests
+    unittest.main(verbosity=2)
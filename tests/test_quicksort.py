@@ -7,7 +7,8 @@ Tests correctness, edge cases, and basic performance characteristics
 import unittest
 import sys
 import os
-import random
+
+import numpy as np
 
 # Add parent directory to path to import modules
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'quicksort'))
@@ -17,9 +18,17 @@ from quick_sort_analyzer import QuickSortAnalyzer
 class TestRandomizedQuicksort(unittest.TestCase):
     """Test cases for Randomized Quicksort implementation"""
     
-    def setUp(self):
-        """Set up test fixtures before each test method"""
-        self.analyzer = QuickSortAnalyzer()
+    @classmethod
+    def setUpClass(cls):
+        """Build shared fixtures once: the analyzer (so any compiled
+        kernel warms up a single time) and seeded random arrays that
+        make every run deterministic"""
+        cls.analyzer = QuickSortAnalyzer()
+        cls.rng = np.random.default_rng(42)
+        cls.random_20 = cls.rng.integers(1, 101, size=20, dtype=np.int64).tolist()
+        cls.random_30 = cls.rng.integers(1, 51, size=30, dtype=np.int64).tolist()
+        cls.random_100 = cls.rng.integers(1, 1001, size=100, dtype=np.int64).tolist()
+        cls.random_200 = cls.rng.integers(1, 51, size=200, dtype=np.int64).tolist()
         
     def test_empty_array(self):
         """Test sorting empty array"""
@@ -72,7 +81,7 @@ class TestRandomizedQuicksort(unittest.TestCase):
         
     def test_random_array(self):
         """Test sorting random array"""
-        arr = [random.randint(1, 100) for _ in range(20)]
+        arr = self.random_20
         original = arr.copy()
         result = self.analyzer.quick_sort_analyzer(arr.copy())
         
@@ -88,7 +97,7 @@ class TestRandomizedQuicksort(unittest.TestCase):
         
     def test_large_array(self):
         """Test sorting larger array"""
-        arr = [random.randint(1, 1000) for _ in range(100)]
+        arr = self.random_100
         original = arr.copy()
         result = self.analyzer.quick_sort_analyzer(arr.copy())
         
@@ -101,7 +110,7 @@ class TestRandomizedQuicksort(unittest.TestCase):
             [3, 1, 4, 1, 5, 9, 2, 6, 5],
             [1, 2, 3, 4, 5],
             [5, 4, 3, 2, 1],
-            [random.randint(1, 50) for _ in range(30)]
+            self.random_30
         ]
         
         for arr in test_arrays:
@@ -112,6 +121,19 @@ class TestRandomizedQuicksort(unittest.TestCase):
             self.assertEqual(rand_result, expected)
             self.assertEqual(det_result, expected)
             
+    def test_parallel_sort(self):
+        """Test that parallel sort matches sequential results"""
+        arr = self.random_200
+        original = arr.copy()
+
+        # Force the multi-process path with a low threshold
+        result = self.analyzer.parallel_quick_sort(arr.copy(), threshold=10)
+        self.assertEqual(result, sorted(original))
+
+        # Below the threshold it falls back to the sequential sort
+        small = [5, 3, 8, 1]
+        self.assertEqual(self.analyzer.parallel_quick_sort(small), [1, 3, 5, 8])
+
     def test_comparison_counting(self):
         """Test that comparison counting works"""
         arr = [3, 1, 4, 1, 5]